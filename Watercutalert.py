@@ -1,57 +1,231 @@
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import google.generativeai as genai
 import os
+import json
+import fcntl
+import re
+import hashlib
+import sqlite3
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import time
-from bs4 import BeautifulSoup # This is the reading tool
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from lxml import html # This is the reading tool (fast C parser)
 
 # --- Configuration ---
 TELEGRAM_TOKEN = os.environ.get('TELEGRAM_TOKEN')
 CHAT_ID = os.environ.get('CHAT_ID')
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
 
+# "read" = open each unclear article and give the AI its text
+# "headline" = decide from headlines only (no website downloads)
+CHECK_MODE = os.environ.get('CHECK_MODE', 'read').strip().lower()
+if CHECK_MODE not in ("read", "headline"):
+    raise ValueError(f"CHECK_MODE must be 'read' or 'headline', got {CHECK_MODE!r}")
+
 MY_AREA_NAME = "F-North Ward / F Ward / Sion / Matunga / Wadala/ CGS"
 
+IST = ZoneInfo('Asia/Kolkata')
+
 RSS_URLS = [
     "https://news.google.com/rss/search?q=Mumbai+water+cut+when:1d&hl=en-IN&gl=IN&ceid=IN:en",
     "https://news.google.com/rss/search?q=BMC+water+supply+when:1d&hl=en-IN&gl=IN&ceid=IN:en"
 ]
 
+# --- Headline keyword filter (decides obvious cases without asking AI) ---
+# Only headlines about water are looked at
+WATER_KEYWORD = re.compile(r'water', re.IGNORECASE)
+# Our area named in the headline -> alert straight away
+MY_AREA_KEYWORDS = re.compile(r'\b(F[- ]?North|Sion|Matunga|Wadala|CGS)\b', re.IGNORECASE)
+# Only other wards named in the headline -> not for us, skip
+OTHER_WARD_KEYWORDS = re.compile(
+    r'\b(F[- ]?South|G[- ]?(North|South)|[HKM][- ]?(East|West)|P[- ]?(North|South)|R[- ]?(North|South|Central))\b',
+    re.IGNORECASE
+)
+
+# One answer line from the AI: "N: YES | summary" or "N: NO"
+DECISION_LINE = re.compile(r'^\s*(\d+)\s*[:.)]\s*(YES|NO)\b(.*)', re.IGNORECASE)
+
+# Saved AI decisions are reused for 24 hours so repeat runs skip the API call
+# Each mode keeps its own cache: a headline-only NO must not be reused when reading articles
+CACHE_DB = os.environ.get('CACHE_DB', 'cache.sqlite' if CHECK_MODE == "read" else 'cache-headline.sqlite')
+CACHE_TTL = 24 * 60 * 60
+# Links already checked on an earlier run are skipped for 2 days
+SEEN_TTL = 2 * 24 * 60 * 60
+
+# Headlines this similar (share of common words) to one already checked today reuse its decision
+SIMILARITY_THRESHOLD = 0.9
+
+# Gemini free tier allows 5 requests per minute (shared by every copy of the script on this machine)
+GEMINI_RPM = 5
+RATE_FILE = os.environ.get('RATE_FILE', 'rate.json')
+
+# Articles sent to Gemini in one request (keeps the prompt a reasonable size)
+BATCH_SIZE = 10
+# Answer length allowed per article ("N: YES | one sentence" fits easily)
+TOKENS_PER_ARTICLE = 60
+
+# Article pages downloaded at the same time
+ARTICLE_WORKERS = 8
+# Only the start of a page is read; the article text is near the top and we keep 3000 chars anyway
+MAX_PAGE_BYTES = 200_000
+
+# Telegram rejects messages longer than this
+TELEGRAM_MAX_CHARS = 4096
+
+# --- Setup HTTP Session (re-uses connections for scraping + Telegram) ---
+session = requests.Session()
+session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+session.mount('https://', adapter)
+session.mount('http://', adapter)
+
+# --- Setup Decision Cache ---
+cache = sqlite3.connect(CACHE_DB)
+cache.execute("CREATE TABLE IF NOT EXISTS decisions (key TEXT PRIMARY KEY, decision TEXT, ts INTEGER)")
+cache.execute("CREATE TABLE IF NOT EXISTS headlines (day TEXT, headline TEXT, decision TEXT)")
+cache.execute("CREATE TABLE IF NOT EXISTS seen_links (link TEXT PRIMARY KEY, ts INTEGER)")
+cache.execute("CREATE TABLE IF NOT EXISTS feeds (url TEXT PRIMARY KEY, etag TEXT, modified TEXT)")
+
+# --- PROMPT: FIXED RULES (same for every article) ---
+# Sent as the system instruction so only the headline + article change per call.
+# Keeping this identical between calls lets Gemini reuse it from its implicit cache.
+SYSTEM_PROMPT = """
+TASK: You are given a numbered list of news articles. Read each article carefully. Does this water cut affect "F-North Ward" (Sion, Matunga, Wadala, CGS Colony)?
+
+LOGIC (apply to each article on its own):
+1. If the article lists specific wards (e.g., "K-East", "H-West") and DOES NOT mention F-North/Sion/Matunga -> Reply NO.
+2. If the article says "Whole Mumbai" or "All Wards" -> Reply NO (Assume false alarm unless F-North is explicitly named).
+3. ONLY Reply YES if you see the words: "F-North", "Sion", "Matunga", "Wadala", "CGS Colony", or "F-Ward".
+
+OUTPUT: One line per article, using its number: "N: YES | [Short Summary]" or "N: NO".
+Keep each summary to one short sentence on the same line; never continue it on a new line.
+"""
+
 # --- Setup Gemini AI ---
 model = None
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
     try:
-        model = genai.GenerativeModel('gemini-2.5-flash-lite')
+        model = genai.GenerativeModel('gemini-2.5-flash-lite', system_instruction=SYSTEM_PROMPT)
         print("   ✅ Connected to Gemini 2.5 Flash-Lite")
     except:
-        model = genai.GenerativeModel('gemini-2.0-flash')
+        model = genai.GenerativeModel('gemini-2.0-flash', system_instruction=SYSTEM_PROMPT)
+
+class RateLimiter:
+    """
+    Keeps calls under a requests-per-minute budget.
+    The times of recent calls live in a locked file, so copies of the script
+    running at the same time on the same machine share one budget.
+    (GitHub Actions runs are kept from overlapping by the workflow instead.)
+    Only waits when the last minute's budget is used up.
+    """
+    def __init__(self, rpm, path):
+        self.rpm = rpm
+        self.path = path
+
+    def acquire(self):
+        with open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)  # Other copies wait here until this call is booked
+            f.seek(0)
+            try: calls = json.load(f)
+            except ValueError: calls = []
+
+            now = time.time()
+            calls = [t for t in calls if now - t < 60]
+            if len(calls) >= self.rpm:
+                wait = 60 - (now - calls[-self.rpm])
+                print(f"      💤 Waiting {wait:.0f}s for Gemini rate limit...")
+                time.sleep(wait)
+                now = time.time()
+                calls = [t for t in calls if now - t < 60]
+
+            calls.append(now)
+            f.truncate(0)
+            json.dump(calls, f)
+
+gemini_limiter = RateLimiter(GEMINI_RPM, RATE_FILE)
 
 def get_ist_time():
-    utc_now = datetime.now(pytz.utc)
-    ist_tz = pytz.timezone('Asia/Kolkata')
-    return utc_now.astimezone(ist_tz)
+    return datetime.now(IST)
 
-def is_published_today(entry_published_struct):
+def is_published_today(entry_published_struct, today_day, today_month):
+    # struct_time fields: [1] = month, [2] = day
     if not entry_published_struct: return False
-    today_ist = get_ist_time().date()
-    pub_date = datetime(*entry_published_struct[:6])
-    return pub_date.day == today_ist.day and pub_date.month == today_ist.month
+    return entry_published_struct[2] == today_day and entry_published_struct[1] == today_month
+
+def cache_key(link, headline):
+    return hashlib.sha256((link + headline).encode()).hexdigest()
+
+def get_cached_decision(link, headline):
+    row = cache.execute(
+        "SELECT decision FROM decisions WHERE key = ? AND ts > ?",
+        (cache_key(link, headline), int(time.time()) - CACHE_TTL)
+    ).fetchone()
+    return row[0] if row else None
+
+def headline_words(headline):
+    # Google News adds " - Source Name" at the end; drop it so outlets compare equal
+    headline = headline.rsplit(" - ", 1)[0]
+    return set(re.findall(r"[a-z0-9-]+", headline.lower()))
+
+def headlines_match(words, other_words):
+    if not words or not other_words: return False
+    return len(words & other_words) / len(words | other_words) >= SIMILARITY_THRESHOLD
+
+def get_similar_decision(headline, day):
+    """
+    Reuses the decision of a near-identical headline (same story, different outlet).
+    """
+    words = headline_words(headline)
+    rows = cache.execute("SELECT headline, decision FROM headlines WHERE day = ?", (day,))
+    for other_headline, decision in rows:
+        if headlines_match(words, headline_words(other_headline)):
+            return decision
+    return None
+
+def save_decision(link, headline, decision, day):
+    cache.execute(
+        "INSERT OR REPLACE INTO decisions (key, decision, ts) VALUES (?, ?, ?)",
+        (cache_key(link, headline), decision, int(time.time()))
+    )
+    cache.execute(
+        "INSERT INTO headlines (day, headline, decision) VALUES (?, ?, ?)",
+        (day, headline, decision)
+    )
+    cache.commit()
+
+def load_seen_links():
+    """
+    Links checked on earlier runs (older ones are forgotten).
+    """
+    cache.execute("DELETE FROM seen_links WHERE ts < ?", (int(time.time()) - SEEN_TTL,))
+    cache.commit()
+    return {link for (link,) in cache.execute("SELECT link FROM seen_links")}
+
+def save_seen_links(links):
+    now = int(time.time())
+    cache.executemany(
+        "INSERT OR REPLACE INTO seen_links (link, ts) VALUES (?, ?)",
+        [(link, now) for link in links]
+    )
+    cache.commit()
 
 def get_article_text(url):
     """
     Downloads the website and extracts the text.
     """
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # timeout=(connect, read) so dead servers fail fast
+        with session.get(url, timeout=(3, 10), stream=True) as response:
+            body = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+        page = html.fromstring(body)
         
         # customized to find text in paragraphs
-        paragraphs = soup.find_all('p')
-        text_content = ' '.join([p.get_text() for p in paragraphs])
+        text_content = ' '.join(page.xpath('//p//text()'))
         
         # Limit text to 3000 chars to avoid confusing AI with ads/footer junk
         return text_content[:3000]
@@ -59,82 +233,260 @@ def get_article_text(url):
         print(f"      ⚠️ Could not scrape text: {e}")
         return "Could not fetch text. Make decision based on Headline only."
 
-def ask_gemini(headline, full_text):
-    if not model: return "NO"
+def ask_gemini(articles):
+    """
+    Asks about a list of (headline, full_text) pairs in a single call.
+    Returns one decision per article, or None where the AI gave no answer.
+    """
+    if not model: return [None] * len(articles)
 
     current_date = get_ist_time().strftime("%Y-%m-%d")
-    
-    # --- PROMPT: READ THE NEWS CONTENT ---
+
+    # --- PROMPT: ONLY THE PARTS THAT CHANGE (rules are in SYSTEM_PROMPT) ---
     prompt = f"""
     Current Date: {current_date}
-    
-    HEADLINE: "{headline}"
-    
+    """
+    for number, (headline, full_text) in enumerate(articles, 1):
+        prompt += f"""
+    {number}) HEADLINE: "{headline}"
     FULL NEWS ARTICLE TEXT: 
     "{full_text}"
+    """
 
-    ---------------------------------------------------
-    TASK: Read the article text above carefully. Does this water cut affect "F-North Ward" (Sion, Matunga, Wadala, CGS Colony)?
+    try:
+        gemini_limiter.acquire()
+        # temperature=0 gives the same answer for the same article every time
+        config = genai.types.GenerationConfig(
+            temperature=0.0,
+            # One extra article's worth of headroom so long early summaries don't cut off the last answers
+            max_output_tokens=TOKENS_PER_ARTICLE * (len(articles) + 1),
+            candidate_count=1
+        )
+        response = model.generate_content(prompt, generation_config=config, stream=True)
+        text = ""
+        try:
+            for chunk in response:
+                text += chunk.text
+                # Stop reading as soon as every article has a finished answer line
+                finished_lines = text.rpartition("\n")[0]
+                if None not in parse_decisions(finished_lines, len(articles)): break
+        except Exception as e:
+            if not text: raise
+            # Keep the answers that already arrived (e.g. an empty last chunk after hitting the token limit).
+            # The unfinished last line is dropped: "2: Y" must be retried, not saved as a NO.
+            print(f"      ⚠️ Gemini reply cut short: {e}")
+            return parse_decisions(text.rpartition("\n")[0], len(articles))
+        return parse_decisions(text, len(articles))
+    except Exception as e:
+        print(f"      ⚠️ Gemini error: {e}")
+        return [None] * len(articles)
 
-    LOGIC:
-    1. If the article lists specific wards (e.g., "K-East", "H-West") and DOES NOT mention F-North/Sion/Matunga -> Reply NO.
-    2. If the article says "Whole Mumbai" or "All Wards" -> Reply NO (Assume false alarm unless F-North is explicitly named).
-    3. ONLY Reply YES if you see the words: "F-North", "Sion", "Matunga", "Wadala", "CGS Colony", or "F-Ward".
+def parse_decisions(text, count):
+    """
+    Turns the "N: YES | ..." / "N: NO" lines back into a list in article order.
+    Articles without a proper YES/NO line stay None (not saved, retried next run).
+    """
+    decisions = [None] * count
+    for line in text.replace('**', '').splitlines():
+        match = DECISION_LINE.match(line)
+        if not match: continue
+        index = int(match.group(1)) - 1
+        # The first answer counts; a wrapped summary line must not overwrite it
+        if 0 <= index < count and decisions[index] is None:
+            decisions[index] = (match.group(2).upper() + match.group(3)).strip()
+    return decisions
 
-    OUTPUT: "YES | [Short Summary]" or "NO".
+def fetch_feeds():
     """
-    
-    try:
-        response = model.generate_content(prompt)
-        return response.text.strip().replace('**', '') 
-    except Exception as e:
-        return "NO"
+    Downloads all RSS feeds at the same time (network-bound, so threads work fine).
+    Feeds that have not changed since the last run (HTTP 304) are left out.
+    Returns the changed feeds and their new ETag / Last-Modified values.
+    """
+    saved = {url: (etag, modified) for url, etag, modified in cache.execute("SELECT url, etag, modified FROM feeds")}
+
+    def parse(url):
+        etag, modified = saved.get(url, (None, None))
+        return feedparser.parse(url, etag=etag, modified=modified)
+
+    with ThreadPoolExecutor(max_workers=len(RSS_URLS)) as executor:
+        feeds = list(executor.map(parse, RSS_URLS))
+
+    changed_feeds = []
+    validators = []  # (url, etag, modified), saved only once the run has handled every entry
+    for url, feed in zip(RSS_URLS, feeds):
+        if feed.get('status') == 304:
+            print(f"   💤 Feed unchanged since last run: {url[:60]}...")
+            continue
+        validators.append((url, feed.get('etag'), feed.get('modified')))
+        changed_feeds.append(feed)
+    return changed_feeds, validators
+
+def save_feed_validators(validators):
+    cache.executemany(
+        "INSERT OR REPLACE INTO feeds (url, etag, modified) VALUES (?, ?, ?)",
+        validators
+    )
+    cache.commit()
+
+def get_headline_only_text(url):
+    return "Article not read (headline-only mode). Make decision based on Headline only."
 
 def send_telegram_message(message):
-    if not TELEGRAM_TOKEN or not CHAT_ID: return
+    """
+    Returns True if Telegram accepted the message.
+    """
+    if not TELEGRAM_TOKEN or not CHAT_ID: return False
     url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
     payload = {"chat_id": CHAT_ID, "text": message, "parse_mode": "Markdown"}
-    requests.post(url, json=payload)
+    try:
+        response = session.post(url, json=payload, timeout=10)
+        if not response.ok:
+            # A stray * _ or [ in a headline or summary breaks Markdown; send it as plain text
+            print(f"      ⚠️ Telegram rejected the message ({response.status_code}). Resending as plain text...")
+            del payload["parse_mode"]
+            response = session.post(url, json=payload, timeout=10)
+        return response.ok
+    except Exception as e:
+        print(f"      ⚠️ Could not send Telegram message: {e}")
+        return False
+
+def send_telegram_digest(alerts):
+    """
+    Sends (link, message) alerts in as few messages as possible, splitting at the Telegram size limit.
+    Returns the links whose alerts were delivered.
+    """
+    separator = "\n\n---\n\n"
+    delivered = []
+    message, links = "", []
+    for link, alert in alerts:
+        if message and len(message) + len(separator) + len(alert) > TELEGRAM_MAX_CHARS:
+            if send_telegram_message(message): delivered += links
+            message, links = "", []
+        message = message + separator + alert if message else alert
+        links.append(link)
+    if message and send_telegram_message(message):
+        delivered += links
+    return delivered
 
 def check_water_cuts():
-    print(f"🔍 Scanning news for {MY_AREA_NAME}...")
+    print(f"🔍 Scanning news for {MY_AREA_NAME} ({CHECK_MODE} mode)...")
     relevant_news_found = False
     seen_links = set()
+    checked_before = load_seen_links()
+    checked_links = []  # links with a final decision, remembered for next run
+    results = []   # (title, link, decision)
+    to_read = []   # (title, link)
+    same_story = {}  # link in to_read -> [(title, link)] of other outlets' copies
+    retry_next_run = False  # something was left unanswered or unsent
 
-    for url in RSS_URLS:
-        feed = feedparser.parse(url)
+    # Similar-headline matches only count within the same day
+    today_ist = get_ist_time().date()
+    today = today_ist.isoformat()
+    cache.execute("DELETE FROM headlines WHERE day != ?", (today,))
+    # Expired decisions are never used again; drop them so the saved cache stays small
+    cache.execute("DELETE FROM decisions WHERE ts < ?", (int(time.time()) - CACHE_TTL,))
+    cache.commit()
+
+    # --- STEP 1: COLLECT TODAY'S WATER NEWS ---
+    feeds, feed_validators = fetch_feeds()
+    for feed in feeds:
         for entry in feed.entries:
             title = entry.title
             link = entry.link
             
             if link in seen_links: continue
             seen_links.add(link)
+            if link in checked_before: continue
 
-            if not is_published_today(entry.published_parsed): continue
-            if 'water' not in title.lower(): continue
+            if not is_published_today(entry.published_parsed, today_ist.day, today_ist.month): continue
+            if not WATER_KEYWORD.search(title): continue
 
             print(f"   👉 Found: {title[:40]}...")
+
+            # --- QUICK KEYWORD CHECK ON THE HEADLINE ---
+            area_match = MY_AREA_KEYWORDS.search(title)
+            if area_match:
+                print(f"      🎯 Headline names '{area_match.group(0)}' (no AI call).")
+                results.append((title, link, f"YES | Headline mentions {area_match.group(0)}."))
+                checked_links.append(link)
+                continue
+            if OTHER_WARD_KEYWORDS.search(title):
+                print("      ⏭️ Headline only names other wards. Skipping.")
+                checked_links.append(link)
+                continue
+
+            # --- CHECK SAVED DECISIONS FIRST ---
+            decision = get_cached_decision(link, title) or get_similar_decision(title, today)
+            if decision:
+                print("      ⚡ Using saved decision (no AI call).")
+                results.append((title, link, decision))
+                checked_links.append(link)
+                continue
+
+            # --- SAME STORY ALREADY QUEUED FROM ANOTHER OUTLET? ---
+            words = headline_words(title)
+            queued = next((q for q in to_read if headlines_match(words, headline_words(q[0]))), None)
+            if queued:
+                print("      🔁 Same story as an article already queued (not reading it again).")
+                same_story.setdefault(queued[1], []).append((title, link))
+                continue
+
+            to_read.append((title, link))
+
+    # --- STEP 2: READ THE WEBSITES AND ASK AI ---
+    # A batch goes to the AI as soon as its pages are in; the rest keep
+    # downloading in the background while the AI call (or rate-limit wait) runs.
+    read_article = get_article_text if CHECK_MODE == "read" else get_headline_only_text
+    if to_read and CHECK_MODE == "read":
+        print(f"   📖 Reading {len(to_read)} full article(s)...")
+    with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as executor:
+        pages = {executor.submit(read_article, link): (title, link) for title, link in to_read}
+        batch = []
+        for done, page in enumerate(as_completed(pages), 1):
+            title, link = pages[page]
+            batch.append((title, link, page.result()))
+            if len(batch) < BATCH_SIZE and done < len(pages): continue
+
+            print(f"   🤖 Asking AI about {len(batch)} article(s)...")
+            decisions = ask_gemini([(title, text) for title, link, text in batch])
+            for (title, link, text), decision in zip(batch, decisions):
+                # Copies of the same story from other outlets share the decision
+                for story_title, story_link in [(title, link)] + same_story.get(link, []):
+                    if decision is None:
+                        # Unanswered articles are not saved, so they get retried next run
+                        results.append((story_title, story_link, "NO"))
+                        retry_next_run = True
+                        continue
+                    save_decision(story_link, story_title, decision, today)
+                    checked_links.append(story_link)
+                    results.append((story_title, story_link, decision))
+            batch = []
+
+    # --- STEP 3: SEND ALERTS (all in one message) ---
+    alerts = []
+    for title, link, decision in results:
+        if decision.startswith("YES"):
+            print(f"   🚨 MATCH FOUND: {title[:40]}...")
+            summary = decision.partition("|")[2].strip() or "Check link."
             
-            # --- NEW STEP: READ THE WEBSITE ---
-            print("      📖 Reading full article...")
-            article_text = get_article_text(link)
-            
-            # --- ASK AI WITH FULL CONTEXT ---
-            decision = ask_gemini(title, article_text)
-            
-            if decision.startswith("YES"):
-                print("      🚨 MATCH FOUND! Sending alert...")
-                try: summary = decision.split("|")[1].strip()
-                except: summary = "Check link."
-                
-                msg = (f"🚰 *Water Cut Alert*\n📍 *CONFIRMED for F-Ward*\n📝 {summary}\n\n📰 {title}\n🔗 [Read Article]({link})")
-                send_telegram_message(msg)
-                relevant_news_found = True
-            else:
-                print(f"      ✅ AI said NO (Not affecting F-North).")
-            
-            print("      💤 Sleeping 12s...")
-            time.sleep(12) 
+            msg = (f"🚰 *Water Cut Alert*\n📍 *CONFIRMED for F-Ward*\n📝 {summary}\n\n📰 {title}\n🔗 [Read Article]({link})")
+            alerts.append((link, msg))
+            relevant_news_found = True
+
+    if alerts:
+        print(f"   📨 Sending {len(alerts)} alert(s)...")
+        undelivered = {link for link, msg in alerts} - set(send_telegram_digest(alerts))
+        if undelivered:
+            # Not remembered as checked, so the saved YES gets sent again next run
+            print(f"   ⚠️ {len(undelivered)} alert(s) not delivered. Will retry next run.")
+            checked_links = [link for link in checked_links if link not in undelivered]
+            retry_next_run = True
+
+    save_seen_links(checked_links)
+    # Keep the old ETags while anything is pending, so next run downloads the feeds
+    # again (no 304) and gets another go at those articles
+    if not retry_next_run:
+        save_feed_validators(feed_validators)
 
     if not relevant_news_found:
         print("   ✅ No detection today.")